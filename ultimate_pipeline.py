@@ -1,19 +1,27 @@
 #!/usr/bin/env python3
 
 import tkinter as tk
-from tkinter import ttk, filedialog, scrolledtext, messagebox
+from tkinter import ttk, filedialog, scrolledtext, messagebox, font as tkfont
 import subprocess
-import threading
+import asyncio
 import json
 import re
 import os
 import sys
 import time
+import functools
+import shutil
+import tempfile
 import webbrowser
+import threading
 from pathlib import Path
+from urllib.parse import urlsplit, parse_qs, unquote
 from datetime import datetime
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, Tuple, Iterator
 from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from collections import deque
 
 try:
     import customtkinter as ctk
@@ -25,6 +33,127 @@ except ImportError:
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+_RGB_CACHE: Dict[str, Tuple[int, int, int]] = {}
+_TK_WINFO_RGB = tk.Misc.winfo_rgb
+
+
+def _winfo_rgb(self, color: str) -> Tuple[int, int, int]:
+    rgb = _RGB_CACHE.get(color)
+    if rgb is None:
+        rgb = _RGB_CACHE[color] = _TK_WINFO_RGB(self, color)
+    return rgb
+
+
+tk.Misc.winfo_rgb = _winfo_rgb
+
+_TEST_CASE_RE = re.compile(r"Test Case '(.*?)' (passed|failed) \(([\d.]+) seconds\)")
+_TEST_SUMMARY_RE = re.compile(r"Executed (\d+) tests?, with (\d+) failures?")
+_BUNDLE_ID_RE = re.compile(rb'PRODUCT_BUNDLE_IDENTIFIER = ([^;]+);')
+_SCHEMES_RE = re.compile(r'Schemes:\s*\n\s*(?!Build Configurations)(\S[^\n]*)')
+
+_TEST_STATUS_MARKUP = {
+    "passed": ("passed", "✅", "success"),
+    "failed": ("failed", "❌", "error"),
+}
+
+_XCRESULT_TEST_STATUS = {
+    "Success": "passed",
+    "Expected Failure": "passed",
+    "Failure": "failed",
+}
+
+_SEVERITY_ROW = {
+    "critical": "🔴 CRITICAL",
+    "warning": "🟡 WARNING",
+    "info": "🔵 INFO",
+}
+
+_TREE_INSERT_BATCH = 200
+
+_LOG_FLUSH_INTERVAL_MS = 33
+_LOG_MAX_LINES = 10000
+
+_TS_FMT = "%H:%M:%S"
+_last_ts_sec = -1
+_last_ts_str = ""
+
+_CPU_COUNT = os.cpu_count() or 1
+
+_EXCLUDED_SOURCE_DIRS = frozenset({
+    "Pods", "Carthage", "DerivedData", ".build", "build", ".git", "node_modules"
+})
+
+_SOURCE_CACHE: Dict[str, Tuple[float, int, List["DiagnosticIssue"]]] = {}
+_SCAN_CANCELLED = threading.Event()
+
+_DEVICE_CACHE_TTL = 10.0
+_DEVICE_CACHE: Dict[str, Tuple[float, List[Dict]]] = {}
+
+_PROJECT_CACHE: Dict[str, "ProjectConfig"] = {}
+
+
+def _cached(key: str, ttl: float, fn) -> List[Dict]:
+    entry = _DEVICE_CACHE.get(key)
+    if entry and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+
+    result = fn()
+    _DEVICE_CACHE[key] = (time.monotonic(), result)
+    return result
+
+
+def _timestamp() -> str:
+    global _last_ts_sec, _last_ts_str
+    now = int(time.time())
+    if now != _last_ts_sec:
+        _last_ts_str = time.strftime(_TS_FMT, time.localtime(now))
+        _last_ts_sec = now
+    return _last_ts_str
+
+
+@functools.lru_cache(maxsize=32)
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    return ctk.CTkFont(size=size, weight=weight)
+
+
+def _init_ttk_style(root) -> Tuple[tkfont.Font, tkfont.Font]:
+    row_font = tkfont.Font(root, family="Helvetica", size=11)
+    heading_font = tkfont.Font(root, family="Helvetica", size=12, weight="bold")
+
+    style = ttk.Style(root)
+    style.configure("Treeview", rowheight=30, font=row_font)
+    style.configure("Treeview.Heading", font=heading_font)
+    return row_font, heading_font
+
+
+_PREFS_FILE = Path.home() / ".ultimate_pipeline.json"
+
+
+def _load_prefs() -> Dict:
+    try:
+        if _PREFS_FILE.exists():
+            return json.loads(_PREFS_FILE.read_text())
+    except Exception:
+        pass
+    return {}
+
+
+def _save_prefs(prefs: Dict):
+    try:
+        _PREFS_FILE.write_text(json.dumps(prefs))
+    except Exception:
+        pass
+
+
+def _open_report_file(report_path: str):
+    try:
+        if sys.platform == "darwin":
+            subprocess.run(["open", report_path], check=False)
+        else:
+            webbrowser.open(f"file://{report_path}")
+    except Exception:
+        pass
+
 
 @dataclass
 class ProjectConfig:
@@ -42,6 +171,15 @@ class TestResult:
     status: str
     duration: float
 
+    @functools.cached_property
+    def status_text(self) -> str:
+        status_emoji = _TEST_STATUS_MARKUP.get(self.status, _TEST_STATUS_MARKUP["failed"])[1]
+        return f"{status_emoji} {self.status.upper()}"
+
+    @functools.cached_property
+    def duration_text(self) -> str:
+        return f"{self.duration:.3f}s"
+
 
 @dataclass
 class DiagnosticIssue:
@@ -51,43 +189,64 @@ class DiagnosticIssue:
     file: Optional[str] = None
     line: Optional[int] = None
 
+    @functools.cached_property
+    def severity_text(self) -> str:
+        return _SEVERITY_ROW.get(self.severity) or f"⚪ {self.severity.upper()}"
+
+    @functools.cached_property
+    def file_name(self) -> str:
+        return os.path.basename(self.file) if self.file else "N/A"
+
 
 class XcodeDetector:
     @staticmethod
     def find_project(directory: str) -> Optional[ProjectConfig]:
-        path = Path(directory)
+        directory = os.path.abspath(directory)
+        cached = _PROJECT_CACHE.get(directory)
+        if cached:
+            return cached
 
-        workspaces = list(path.glob("*.xcworkspace"))
-        if workspaces:
-            workspace = workspaces[0]
-            name = workspace.stem
-            return ProjectConfig(
+        workspace = project = None
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".xcworkspace"):
+                        workspace = Path(entry.path)
+                        break
+                    if project is None and entry.name.endswith(".xcodeproj"):
+                        project = Path(entry.path)
+        except OSError:
+            return None
+
+        if workspace:
+            scheme = XcodeDetector._detect_scheme(directory, workspace.name, True)
+            config = ProjectConfig(
                 path=directory,
-                name=name,
+                name=workspace.stem,
                 project_file=workspace.name,
-                scheme=XcodeDetector._detect_scheme(directory, workspace.name, True),
+                scheme=scheme or workspace.stem,
                 is_workspace=True,
                 bundle_id=None
             )
-
-        projects = list(path.glob("*.xcodeproj"))
-        if projects:
-            project = projects[0]
-            name = project.stem
-            bundle_id = XcodeDetector._detect_bundle_id(project)
-            return ProjectConfig(
+        elif project:
+            scheme = XcodeDetector._detect_scheme(directory, project.name, False)
+            config = ProjectConfig(
                 path=directory,
-                name=name,
+                name=project.stem,
                 project_file=project.name,
-                scheme=XcodeDetector._detect_scheme(directory, project.name, False),
+                scheme=scheme or project.stem,
                 is_workspace=False,
-                bundle_id=bundle_id
+                bundle_id=XcodeDetector._detect_bundle_id(project)
             )
+        else:
+            return None
 
-        return None
+        if scheme:
+            _PROJECT_CACHE[directory] = config
+        return config
 
     @staticmethod
-    def _detect_scheme(directory: str, project_file: str, is_workspace: bool) -> str:
+    def _detect_scheme(directory: str, project_file: str, is_workspace: bool) -> Optional[str]:
         try:
             cmd = ["xcodebuild", "-list"]
             if is_workspace:
@@ -98,36 +257,45 @@ class XcodeDetector:
             result = subprocess.run(cmd, cwd=directory, capture_output=True, text=True, timeout=30)
 
             if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                in_schemes = False
-
-                for line in lines:
-                    line = line.strip()
-                    if "Schemes:" in line:
-                        in_schemes = True
-                        continue
-                    if in_schemes and line and not line.startswith("Build Configurations"):
-                        return line
-
-            return Path(project_file).stem
+                match = _SCHEMES_RE.search(result.stdout)
+                if match:
+                    return match.group(1).strip()
+
+            return None
         except Exception:
-            return Path(project_file).stem
+            return None
 
     @staticmethod
     def _detect_bundle_id(project_path: Path) -> Optional[str]:
         try:
             pbxproj = project_path / "project.pbxproj"
             if pbxproj.exists():
-                content = pbxproj.read_text()
-                match = re.search(r'PRODUCT_BUNDLE_IDENTIFIER = ([^;]+);', content)
-                if match:
-                    return match.group(1).strip().strip('"')
+                with pbxproj.open("rb") as f:
+                    tail = b""
+                    for chunk in iter(lambda: f.read(65536), b""):
+                        window = tail + chunk
+                        match = _BUNDLE_ID_RE.search(window)
+                        if match:
+                            return match.group(1).decode("utf-8", errors="replace").strip().strip('"')
+                        tail = window[window.rfind(b"\n") + 1:]
         except Exception:
             pass
         return None
 
     @staticmethod
     def get_simulators() -> List[Dict]:
+        return _cached("simulators", _DEVICE_CACHE_TTL, XcodeDetector._list_simulators)
+
+    @staticmethod
+    def get_devices() -> List[Dict]:
+        return _cached("devices", _DEVICE_CACHE_TTL, XcodeDetector._list_devices)
+
+    @staticmethod
+    def invalidate_cache():
+        _DEVICE_CACHE.clear()
+
+    @staticmethod
+    def _list_simulators() -> List[Dict]:
         try:
             result = subprocess.run(
                 ["xcrun", "simctl", "list", "devices", "available", "iOS", "-j"],
@@ -136,7 +304,7 @@ class XcodeDetector:
                 timeout=30
             )
 
-            if result.returncode != 0:
+            if result.returncode != 0 or "iPhone" not in result.stdout:
                 return []
 
             data = json.loads(result.stdout)
@@ -158,7 +326,7 @@ class XcodeDetector:
             return []
 
     @staticmethod
-    def get_devices() -> List[Dict]:
+    def _list_devices() -> List[Dict]:
         try:
             result = subprocess.run(
                 ["xcrun", "xctrace", "list", "devices"],
@@ -202,56 +370,113 @@ class XcodeDetector:
 
 class CommandRunner:
     @staticmethod
-    def run(cmd: List[str], cwd: str, callback=None) -> Tuple[bool, str, str]:
+    async def run_async(cmd: List[str], cwd: str, callback=None, skip_indexing: bool = False,
+                        keep_output: bool = True) -> Tuple[bool, str, str]:
         try:
-            process = subprocess.Popen(
-                cmd,
+            process = await asyncio.create_subprocess_exec(
+                *CommandRunner._prepare(cmd, skip_indexing),
                 cwd=cwd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT
             )
+        except Exception as e:
+            return False, "", str(e)
 
-            output_lines = []
-            for line in iter(process.stdout.readline, ''):
-                if not line:
+        try:
+            output = bytearray()
+            emitted = 0
+            while True:
+                chunk = await process.stdout.read(65536)
+                if not chunk:
                     break
-                output_lines.append(line)
+                output.extend(chunk)
                 if callback:
-                    callback(line)
-
-            process.wait()
-            output = "".join(output_lines)
-            return process.returncode == 0, output, ""
+                    emitted = CommandRunner._emit_lines(output, emitted, callback)
+                if not keep_output:
+                    del output[:emitted]
+                    emitted = 0
+
+            await process.wait()
+        except asyncio.CancelledError:
+            process.kill()
+            raise
         except Exception as e:
             return False, "", str(e)
 
+        if callback and emitted < len(output):
+            callback(output[emitted:].decode("utf-8", errors="replace"))
+        if not keep_output:
+            return process.returncode == 0, "", ""
+        return process.returncode == 0, output.decode("utf-8", errors="replace"), ""
+
+    @staticmethod
+    def _emit_lines(output: bytearray, emitted: int, callback) -> int:
+        line_end = output.rfind(b'\n') + 1
+        if line_end > emitted:
+            callback(output[emitted:line_end].decode("utf-8", errors="replace"))
+            return line_end
+        return emitted
+
+    @staticmethod
+    def _prepare(cmd: List[str], skip_indexing: bool) -> List[str]:
+        if not cmd or Path(cmd[0]).name != "xcodebuild":
+            return cmd
+
+        cmd = list(cmd)
+        if not any(arg.startswith("-IDEBuildOperationMaxNumberOfConcurrentCompileTasks") for arg in cmd):
+            cmd.append(f"-IDEBuildOperationMaxNumberOfConcurrentCompileTasks={_CPU_COUNT}")
+        if skip_indexing:
+            cmd.append("COMPILER_INDEX_STORE_ENABLE=NO")
+        return cmd
+
+
+class ResultBundleReader:
+    @staticmethod
+    async def load(bundle_path: str, ref_id: Optional[str] = None) -> Optional[Dict]:
+        cmd = ["xcrun", "xcresulttool", "get", "--format", "json", "--path", bundle_path]
+        if ref_id:
+            cmd.extend(["--id", ref_id])
+
+        for extra_args in ([], ["--legacy"]):
+            success, output, _ = await CommandRunner.run_async(cmd + extra_args, os.path.dirname(bundle_path))
+            if success:
+                try:
+                    return await asyncio.get_running_loop().run_in_executor(None, json.loads, output)
+                except ValueError:
+                    return None
+
+        return None
+
+    @staticmethod
+    async def load_tests(bundle_path: str) -> Optional[Dict]:
+        record = await ResultBundleReader.load(bundle_path)
+        if not record:
+            return None
+
+        for action in record.get("actions", {}).get("_values", []):
+            tests_ref = action.get("actionResult", {}).get("testsRef", {}).get("id", {}).get("_value")
+            if tests_ref:
+                return await ResultBundleReader.load(bundle_path, tests_ref)
+
+        return None
+
 
 class TestParser:
     @staticmethod
     def parse_results(output: str) -> Tuple[List[TestResult], int, int, int]:
         tests = []
-        pattern = r"Test Case '(.*?)' (passed|failed) \(([\d.]+) seconds\)"
 
-        for match in re.finditer(pattern, output):
+        for match in _TEST_CASE_RE.finditer(output):
             test_name = match.group(1)
-            status = match.group(2)
-            duration = float(match.group(3))
-
-            if '.' in test_name:
-                parts = test_name.split('.')
-                if len(parts) >= 2:
-                    test_name = f"{parts[-2]}.{parts[-1]}"
+            name_start = test_name.rfind('.', 0, test_name.rfind('.')) + 1
 
             tests.append(TestResult(
-                name=test_name,
-                status=status,
-                duration=duration
+                name=test_name[name_start:],
+                status=match.group(2),
+                duration=float(match.group(3))
             ))
 
-        summary_pattern = r"Executed (\d+) tests?, with (\d+) failures?"
-        summary_match = re.search(summary_pattern, output)
+        summary_match = _TEST_SUMMARY_RE.search(output)
 
         if summary_match:
             total = int(summary_match.group(1))
@@ -266,6 +491,40 @@ class TestParser:
 
         return tests, total, passed, failed
 
+    @staticmethod
+    def parse_result_bundle(summaries: Dict) -> Tuple[List[TestResult], int, int, int]:
+        tests = []
+        pending = [
+            testable
+            for summary in summaries.get("summaries", {}).get("_values", [])
+            for testable in summary.get("testableSummaries", {}).get("_values", [])
+        ]
+        pending.reverse()
+
+        while pending:
+            node = pending.pop()
+            children = node.get("tests") or node.get("subtests")
+            if children:
+                pending.extend(reversed(children.get("_values", [])))
+                continue
+
+            status = _XCRESULT_TEST_STATUS.get(node.get("testStatus", {}).get("_value"))
+            if status:
+                tests.append(TestResult(
+                    name=node.get("identifier", {}).get("_value", "").rstrip("()").replace("/", "."),
+                    status=status,
+                    duration=float(node.get("duration", {}).get("_value", 0))
+                ))
+
+        passed = failed = 0
+        for test in tests:
+            if test.status == "passed":
+                passed += 1
+            else:
+                failed += 1
+
+        return tests, len(tests), passed, failed
+
 
 class DiagnosticsEngine:
     @staticmethod
@@ -273,13 +532,14 @@ class DiagnosticsEngine:
         issues = []
 
         for line in output.split('\n'):
-            if "error:" in line.lower():
+            low = line.lower()
+            if "error:" in low:
                 issues.append(DiagnosticIssue(
                     category="Build Error",
                     severity="critical",
                     message=line.strip()
                 ))
-            elif "warning:" in line.lower():
+            elif "warning:" in low:
                 issues.append(DiagnosticIssue(
                     category="Build Warning",
                     severity="warning",
@@ -288,17 +548,96 @@ class DiagnosticsEngine:
 
         return issues
 
+    @staticmethod
+    def analyze_build_result(record: Dict) -> List[DiagnosticIssue]:
+        issues = []
+        summaries = record.get("issues", {})
+
+        for key, category, severity in (
+            ("errorSummaries", "Build Error", "critical"),
+            ("warningSummaries", "Build Warning", "warning")
+        ):
+            for summary in summaries.get(key, {}).get("_values", []):
+                file, line = DiagnosticsEngine._document_location(summary)
+                issues.append(DiagnosticIssue(
+                    category=category,
+                    severity=severity,
+                    message=summary.get("message", {}).get("_value", ""),
+                    file=file,
+                    line=line
+                ))
+
+        return issues
+
+    @staticmethod
+    def _document_location(summary: Dict) -> Tuple[Optional[str], Optional[int]]:
+        url = summary.get("documentLocationInEditor", {}).get("url", {}).get("_value")
+        if not url:
+            return None, None
+
+        location = urlsplit(url)
+        line = parse_qs(location.fragment).get("StartingLineNumber")
+        return unquote(location.path), int(line[0]) + 1 if line else None
+
     @staticmethod
     def analyze_source_code(project_path: str) -> List[DiagnosticIssue]:
         issues = []
-        path = Path(project_path)
-        swift_files = list(path.rglob("*.swift"))
+        swift_files = []
+
+        for root, dirs, files in os.walk(project_path):
+            dirs[:] = [d for d in dirs if d not in _EXCLUDED_SOURCE_DIRS]
+            swift_files.extend(Path(root) / f for f in files if f.endswith(".swift"))
+
+        cache_file = Path(project_path) / "pipeline_reports" / ".diag_cache.json"
+        DiagnosticsEngine._load_source_cache(cache_file)
+
+        with ThreadPoolExecutor(max_workers=min(32, _CPU_COUNT * 4)) as executor:
+            for file_issues in executor.map(DiagnosticsEngine._analyze_swift_file, swift_files):
+                issues.extend(file_issues)
+
+        DiagnosticsEngine._save_source_cache(cache_file, swift_files)
+        return issues
 
+    @staticmethod
+    def _load_source_cache(cache_file: Path):
+        try:
+            if cache_file.exists():
+                for key, (mtime, size, cached_issues) in json.loads(cache_file.read_text()).items():
+                    _SOURCE_CACHE.setdefault(key, (mtime, size, [DiagnosticIssue(**i) for i in cached_issues]))
+        except Exception:
+            pass
+
+    @staticmethod
+    def _save_source_cache(cache_file: Path, swift_files: List[Path]):
+        entries = {}
         for swift_file in swift_files:
-            try:
-                content = swift_file.read_text()
+            cached = _SOURCE_CACHE.get(str(swift_file))
+            if cached:
+                entries[str(swift_file)] = [cached[0], cached[1], [asdict(i) for i in cached[2]]]
 
-                if "try!" in content or "force try!" in content:
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            cache_file.write_text(json.dumps(entries))
+        except Exception:
+            pass
+
+    @staticmethod
+    def _analyze_swift_file(swift_file: Path) -> List[DiagnosticIssue]:
+        if _SCAN_CANCELLED.is_set():
+            return []
+
+        issues = []
+
+        try:
+            stat = swift_file.stat()
+            cached = _SOURCE_CACHE.get(str(swift_file))
+            if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+                return cached[2]
+
+            content = swift_file.read_text()
+
+            if "!" in content:
+                if "try!" in content:
                     issues.append(DiagnosticIssue(
                         category="Code Quality",
                         severity="warning",
@@ -315,7 +654,9 @@ class DiagnosticsEngine:
                         file=str(swift_file)
                     ))
 
-                if "print(" in content and content.count("print(") > 5:
+            if "print(" in content:
+                print_count = content.count("print(")
+                if print_count > 5:
                     issues.append(DiagnosticIssue(
                         category="Code Quality",
                         severity="info",
@@ -323,57 +664,41 @@ class DiagnosticsEngine:
                         file=str(swift_file)
                     ))
 
-                line_count = len(content.split('\n'))
-                if line_count > 500:
-                    issues.append(DiagnosticIssue(
-                        category="Code Quality",
-                        severity="info",
-                        message=f"Very long file: {swift_file.name} ({line_count} lines)",
-                        file=str(swift_file)
-                    ))
-            except Exception:
-                pass
-
-        return issues
+            line_count = content.count('\n') + 1
+            if line_count > 500:
+                issues.append(DiagnosticIssue(
+                    category="Code Quality",
+                    severity="info",
+                    message=f"Very long file: {swift_file.name} ({line_count} lines)",
+                    file=str(swift_file)
+                ))
 
+            _SOURCE_CACHE[str(swift_file)] = (stat.st_mtime, stat.st_size, issues)
+        except Exception:
+            pass
 
-class ReportGenerator:
-    @staticmethod
-    def generate_html(project_config: ProjectConfig, tests: List[TestResult],
-                     issues: List[DiagnosticIssue], build_success: bool) -> str:
-        passed = sum(1 for t in tests if t.status == "passed")
-        failed = sum(1 for t in tests if t.status == "failed")
-        total = len(tests)
+        return issues
 
-        critical_issues = sum(1 for i in issues if i.severity == "critical")
-        warning_issues = sum(1 for i in issues if i.severity == "warning")
-        info_issues = sum(1 for i in issues if i.severity == "info")
 
-        html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Ultimate Pipeline Report - {project_config.name}</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+_REPORT_CSS = """
+        * { margin: 0; padding: 0; box-sizing: border-box; }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 50%, #f093fb 100%);
             min-height: 100vh;
             padding: 40px 20px;
             animation: gradientShift 15s ease infinite;
             background-size: 200% 200%;
-        }}
+        }
 
-        @keyframes gradientShift {{
-            0% {{ background-position: 0% 50%; }}
-            50% {{ background-position: 100% 50%; }}
-            100% {{ background-position: 0% 50%; }}
-        }}
+        @keyframes gradientShift {
+            0% { background-position: 0% 50%; }
+            50% { background-position: 100% 50%; }
+            100% { background-position: 0% 50%; }
+        }
 
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             background: rgba(255, 255, 255, 0.95);
@@ -382,22 +707,22 @@ class ReportGenerator:
             box-shadow: 0 30px 90px rgba(0, 0, 0, 0.3);
             overflow: hidden;
             animation: slideIn 0.8s cubic-bezier(0.68, -0.55, 0.265, 1.55);
-        }}
+        }
 
-        @keyframes slideIn {{
-            from {{ opacity: 0; transform: translateY(50px) scale(0.9); }}
-            to {{ opacity: 1; transform: translateY(0) scale(1); }}
-        }}
+        @keyframes slideIn {
+            from { opacity: 0; transform: translateY(50px) scale(0.9); }
+            to { opacity: 1; transform: translateY(0) scale(1); }
+        }
 
-        .header {{
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 60px 40px;
             position: relative;
             overflow: hidden;
-        }}
+        }
 
-        .header::before {{
+        .header::before {
             content: '';
             position: absolute;
             top: 0;
@@ -407,38 +732,38 @@ class ReportGenerator:
             background: url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1440 320"><path fill="%23ffffff" fill-opacity="0.1" d="M0,96L48,112C96,128,192,160,288,160C384,160,480,128,576,122.7C672,117,768,139,864,138.7C960,139,1056,117,1152,101.3C1248,85,1344,75,1392,69.3L1440,64L1440,320L1392,320C1344,320,1248,320,1152,320C1056,320,960,320,864,320C768,320,672,320,576,320C480,320,384,320,288,320C192,320,96,320,48,320L0,320Z"></path></svg>');
             background-size: cover;
             animation: wave 20s linear infinite;
-        }}
+        }
 
-        @keyframes wave {{
-            from {{ transform: translateX(0); }}
-            to {{ transform: translateX(-50%); }}
-        }}
+        @keyframes wave {
+            from { transform: translateX(0); }
+            to { transform: translateX(-50%); }
+        }
 
-        .header h1 {{
+        .header h1 {
             font-size: 3.5em;
             font-weight: 800;
             margin-bottom: 15px;
             text-shadow: 0 4px 20px rgba(0, 0, 0, 0.3);
             position: relative;
             z-index: 1;
-        }}
+        }
 
-        .header .subtitle {{
+        .header .subtitle {
             font-size: 1.3em;
             opacity: 0.95;
             position: relative;
             z-index: 1;
-        }}
+        }
 
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 30px;
             padding: 50px 40px;
             background: linear-gradient(to bottom, #f8f9fa, #ffffff);
-        }}
+        }
 
-        .stat-card {{
+        .stat-card {
             background: white;
             padding: 35px;
             border-radius: 20px;
@@ -446,9 +771,9 @@ class ReportGenerator:
             transition: all 0.4s cubic-bezier(0.68, -0.55, 0.265, 1.55);
             position: relative;
             overflow: hidden;
-        }}
+        }
 
-        .stat-card::before {{
+        .stat-card::before {
             content: '';
             position: absolute;
             top: 0;
@@ -456,38 +781,38 @@ class ReportGenerator:
             right: 0;
             height: 5px;
             background: linear-gradient(90deg, var(--card-color-1), var(--card-color-2));
-        }}
+        }
 
-        .stat-card:hover {{
+        .stat-card:hover {
             transform: translateY(-10px) scale(1.02);
             box-shadow: 0 20px 60px rgba(0, 0, 0, 0.15);
-        }}
+        }
 
-        .stat-card.success {{
+        .stat-card.success {
             --card-color-1: #667eea;
             --card-color-2: #764ba2;
-        }}
+        }
 
-        .stat-card.warning {{
+        .stat-card.warning {
             --card-color-1: #f093fb;
             --card-color-2: #f5576c;
-        }}
+        }
 
-        .stat-card.info {{
+        .stat-card.info {
             --card-color-1: #4facfe;
             --card-color-2: #00f2fe;
-        }}
+        }
 
-        .stat-card h3 {{
+        .stat-card h3 {
             color: #666;
             font-size: 0.95em;
             margin-bottom: 15px;
             text-transform: uppercase;
             letter-spacing: 1px;
             font-weight: 600;
-        }}
+        }
 
-        .stat-card .number {{
+        .stat-card .number {
             font-size: 3.5em;
             font-weight: 800;
             background: linear-gradient(135deg, var(--card-color-1), var(--card-color-2));
@@ -495,28 +820,28 @@ class ReportGenerator:
             -webkit-text-fill-color: transparent;
             background-clip: text;
             margin-bottom: 10px;
-        }}
+        }
 
-        .stat-card .label {{
+        .stat-card .label {
             color: #999;
             font-size: 0.9em;
-        }}
+        }
 
-        .content {{
+        .content {
             padding: 50px 40px;
-        }}
+        }
 
-        .section {{
+        .section {
             margin-bottom: 50px;
             animation: fadeIn 1s ease;
-        }}
+        }
 
-        @keyframes fadeIn {{
-            from {{ opacity: 0; transform: translateY(20px); }}
-            to {{ opacity: 1; transform: translateY(0); }}
-        }}
+        @keyframes fadeIn {
+            from { opacity: 0; transform: translateY(20px); }
+            to { opacity: 1; transform: translateY(0); }
+        }
 
-        .section h2 {{
+        .section h2 {
             font-size: 2em;
             margin-bottom: 30px;
             background: linear-gradient(135deg, #667eea, #764ba2);
@@ -526,61 +851,61 @@ class ReportGenerator:
             display: flex;
             align-items: center;
             gap: 15px;
-        }}
+        }
 
-        .section h2::before {{
+        .section h2::before {
             content: '';
             width: 6px;
             height: 40px;
             background: linear-gradient(180deg, #667eea, #764ba2);
             border-radius: 10px;
-        }}
+        }
 
-        .test-grid {{
+        .test-grid {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(400px, 1fr));
             gap: 20px;
-        }}
+        }
 
-        .test-item {{
+        .test-item {
             background: #f8f9fa;
             padding: 20px 25px;
             border-radius: 15px;
             border-left: 5px solid;
             transition: all 0.3s ease;
             cursor: pointer;
-        }}
+        }
 
-        .test-item:hover {{
+        .test-item:hover {
             transform: translateX(5px);
             box-shadow: 0 5px 20px rgba(0, 0, 0, 0.1);
-        }}
+        }
 
-        .test-item.passed {{
+        .test-item.passed {
             border-left-color: #667eea;
             background: linear-gradient(to right, rgba(102, 126, 234, 0.05), transparent);
-        }}
+        }
 
-        .test-item.failed {{
+        .test-item.failed {
             border-left-color: #f5576c;
             background: linear-gradient(to right, rgba(245, 87, 108, 0.05), transparent);
-        }}
+        }
 
-        .test-item .test-name {{
+        .test-item .test-name {
             font-weight: 600;
             margin-bottom: 8px;
             color: #333;
             font-size: 0.95em;
-        }}
+        }
 
-        .test-item .test-meta {{
+        .test-item .test-meta {
             display: flex;
             justify-content: space-between;
             color: #666;
             font-size: 0.85em;
-        }}
+        }
 
-        .badge {{
+        .badge {
             display: inline-block;
             padding: 6px 16px;
             border-radius: 20px;
@@ -588,28 +913,28 @@ class ReportGenerator:
             font-weight: 700;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
 
-        .badge.success {{
+        .badge.success {
             background: linear-gradient(135deg, #667eea, #764ba2);
             color: white;
-        }}
+        }
 
-        .badge.error {{
+        .badge.error {
             background: linear-gradient(135deg, #f5576c, #f093fb);
             color: white;
-        }}
+        }
 
-        .badge.warning {{
+        .badge.warning {
             background: linear-gradient(135deg, #fbc2eb, #a6c1ee);
             color: #333;
-        }}
+        }
 
-        .issue-list {{
+        .issue-list {
             list-style: none;
-        }}
+        }
 
-        .issue-item {{
+        .issue-item {
             background: white;
             padding: 20px;
             margin-bottom: 15px;
@@ -617,82 +942,120 @@ class ReportGenerator:
             border-left: 4px solid;
             box-shadow: 0 2px 10px rgba(0, 0, 0, 0.05);
             transition: all 0.3s ease;
-        }}
+        }
 
-        .issue-item:hover {{
+        .issue-item:hover {
             box-shadow: 0 5px 25px rgba(0, 0, 0, 0.1);
             transform: translateX(5px);
-        }}
+        }
 
-        .issue-item.critical {{
+        .issue-item.critical {
             border-left-color: #f5576c;
-        }}
+        }
 
-        .issue-item.warning {{
+        .issue-item.warning {
             border-left-color: #fbc2eb;
-        }}
+        }
 
-        .issue-item.info {{
+        .issue-item.info {
             border-left-color: #4facfe;
-        }}
+        }
 
-        .footer {{
+        .footer {
             background: linear-gradient(135deg, #2c3e50, #3498db);
             color: white;
             padding: 40px;
             text-align: center;
-        }}
+        }
 
-        .footer p {{
+        .footer p {
             margin: 10px 0;
             opacity: 0.9;
-        }}
+        }
 
-        .project-info {{
+        .project-info {
             background: white;
             padding: 30px;
             border-radius: 15px;
             margin-bottom: 30px;
             box-shadow: 0 5px 20px rgba(0, 0, 0, 0.05);
-        }}
+        }
 
-        .project-info table {{
+        .project-info table {
             width: 100%;
             border-collapse: collapse;
-        }}
+        }
 
-        .project-info td {{
+        .project-info td {
             padding: 12px;
             border-bottom: 1px solid #f0f0f0;
-        }}
+        }
 
-        .project-info td:first-child {{
+        .project-info td:first-child {
             font-weight: 600;
             color: #667eea;
             width: 200px;
-        }}
+        }
 
-        .progress-bar {{
+        .progress-bar {
             height: 10px;
             background: #e0e0e0;
             border-radius: 10px;
             overflow: hidden;
             margin: 20px 0;
-        }}
+        }
 
-        .progress-fill {{
+        .progress-fill {
             height: 100%;
             background: linear-gradient(90deg, #667eea, #764ba2, #f093fb);
             background-size: 200% 100%;
             animation: progressShine 2s linear infinite;
             transition: width 0.5s ease;
-        }}
+        }
+
+        @keyframes progressShine {
+            0% { background-position: 200% 0; }
+            100% { background-position: -200% 0; }
+        }
+    """
+
 
-        @keyframes progressShine {{
-            0% {{ background-position: 200% 0; }}
-            100% {{ background-position: -200% 0; }}
-        }}
-    </style>
+class ReportGenerator:
+    @staticmethod
+    def stream_html(path: str, project_config: ProjectConfig, tests: List[TestResult],
+                    issues: List[DiagnosticIssue], build_success: bool) -> str:
+        with open(path, "w", encoding="utf-8", newline="", buffering=1024 * 1024) as f:
+            for part in ReportGenerator._iter_html(project_config, tests, issues, build_success):
+                f.write(part)
+        return path
+
+    @staticmethod
+    def report_path(project_path: str) -> str:
+        reports_dir = Path(project_path) / "pipeline_reports"
+        reports_dir.mkdir(exist_ok=True)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return str(reports_dir / f"ultimate_pipeline_report_{timestamp}.html")
+
+    @staticmethod
+    def _iter_html(project_config: ProjectConfig, tests: List[TestResult],
+                   issues: List[DiagnosticIssue], build_success: bool) -> Iterator[str]:
+        passed = failed = 0
+        for test in tests:
+            if test.status == "passed":
+                passed += 1
+            elif test.status == "failed":
+                failed += 1
+        total = len(tests)
+        success_rate = (passed / total * 100) if total > 0 else 0
+
+        yield f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Ultimate Pipeline Report - {project_config.name}</title>
+    <style>{_REPORT_CSS}</style>
 </head>
 <body>
     <div class="container">
@@ -740,7 +1103,7 @@ class ReportGenerator:
             </div>
             <div class="stat-card info">
                 <h3>Success Rate</h3>
-                <div class="number">{(passed/total*100) if total > 0 else 0:.1f}%</div>
+                <div class="number">{success_rate:.1f}%</div>
                 <div class="label">overall performance</div>
             </div>
             <div class="stat-card warning">
@@ -754,45 +1117,46 @@ class ReportGenerator:
             <div class="section">
                 <h2>🧪 Test Results</h2>
                 <div class="progress-bar">
-                    <div class="progress-fill" style="width: {(passed/total*100) if total > 0 else 0}%"></div>
+                    <div class="progress-fill" style="width: {success_rate}%"></div>
                 </div>
                 <div class="test-grid">
 """
 
-        for test in tests[:50]:
-            status_class = "passed" if test.status == "passed" else "failed"
-            status_emoji = "✅" if test.status == "passed" else "❌"
-            html += f"""
+        for test in islice(tests, 50):
+            status_class, status_emoji, badge_class = _TEST_STATUS_MARKUP.get(
+                test.status, _TEST_STATUS_MARKUP["failed"]
+            )
+            yield f"""
                     <div class="test-item {status_class}">
                         <div class="test-name">{status_emoji} {test.name}</div>
                         <div class="test-meta">
-                            <span class="badge {'success' if test.status == 'passed' else 'error'}">{test.status.upper()}</span>
+                            <span class="badge {badge_class}">{test.status.upper()}</span>
                             <span>⏱️ {test.duration:.3f}s</span>
                         </div>
                     </div>
 """
 
         if len(tests) > 50:
-            html += f"""
+            yield f"""
                     <div class="test-item">
                         <div class="test-name">... and {len(tests) - 50} more tests</div>
                     </div>
 """
 
-        html += """
+        yield """
                 </div>
             </div>
 """
 
         if issues:
-            html += """
+            yield """
             <div class="section">
                 <h2>⚠️ Diagnostic Issues</h2>
                 <ul class="issue-list">
 """
 
-            for issue in issues[:100]:
-                html += f"""
+            for issue in islice(issues, 100):
+                yield f"""
                     <li class="issue-item {issue.severity}">
                         <div style="display: flex; justify-content: space-between; align-items: center;">
                             <div>
@@ -806,18 +1170,18 @@ class ReportGenerator:
 """
 
             if len(issues) > 100:
-                html += f"""
+                yield f"""
                     <li class="issue-item info">
                         <strong>... and {len(issues) - 100} more issues</strong>
                     </li>
 """
 
-            html += """
+            yield """
                 </ul>
             </div>
 """
 
-        html += f"""
+        yield f"""
         </div>
 
         <div class="footer">
@@ -830,19 +1194,6 @@ class ReportGenerator:
 </html>
 """
 
-        return html
-
-    @staticmethod
-    def save_report(html: str, project_path: str) -> str:
-        reports_dir = Path(project_path) / "pipeline_reports"
-        reports_dir.mkdir(exist_ok=True)
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_path = reports_dir / f"ultimate_pipeline_report_{timestamp}.html"
-        report_path.write_text(html)
-
-        return str(report_path)
-
 
 class AnimatedButton(ctk.CTkButton):
     def __init__(self, *args, **kwargs):
@@ -858,20 +1209,63 @@ class AnimatedButton(ctk.CTkButton):
         self.configure(cursor="")
 
 
+_SIDEBAR_BUTTONS = (
+    ("📁 Open Project", "_select_project", "#667eea", "#764ba2", None),
+    ("📱 Select Target", "_select_target", "#f093fb", "#f5576c", None),
+    ("🔨 Build Project", "_build_project", "#4facfe", "#00f2fe", "build_btn"),
+    ("🧪 Run Tests", "_run_tests", "#43e97b", "#38f9d7", "test_btn"),
+    ("🔍 Run Diagnostics", "_run_diagnostics", "#fa709a", "#fee140", "diagnostics_btn"),
+    ("📊 Generate Report", "_generate_report", "#30cfd0", "#330867", "report_btn"),
+)
+
+_WELCOME_TITLE = "Welcome to Ultimate Pipeline! 🚀"
+_WELCOME_SUBTITLE = "The most advanced Xcode build, test, and diagnostics tool"
+_FEATURES_TEXT = """✨ Features:
+
+• Automatic project detection and configuration
+• Build automation with real-time progress tracking
+• Comprehensive test execution and reporting
+• Deep diagnostics and code quality analysis
+• Beautiful HTML reports with interactive visualizations
+• Support for simulators and physical devices
+• No hardcoded values - works with any project
+
+Get started by opening a project or let the app auto-detect your current one!"""
+_WELCOME_TEXT = "\n\n".join((_WELCOME_TITLE, _WELCOME_SUBTITLE, _FEATURES_TEXT))
+
+
 class UltimatePipelineApp:
     def __init__(self):
         self.root = ctk.CTk()
         self.root.title("Ultimate Pipeline - Xcode Build & Diagnostics")
         self.root.geometry("1400x900")
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._tree_fonts = _init_ttk_style(self.root)
 
         self.project_config: Optional[ProjectConfig] = None
         self.selected_target: Optional[Dict] = None
         self.test_results: List[TestResult] = []
         self.diagnostic_issues: List[DiagnosticIssue] = []
         self.build_success = False
+        self._rendered_tests = (None, 0)
+        self._rendered_issues = (None, 0)
+        self._test_rows: Dict[Tuple, Tuple] = {}
+        self._issue_rows: Dict[Tuple, Tuple] = {}
+        self._log_buffer = deque(maxlen=_LOG_MAX_LINES)
+        self._log_flush_scheduled = False
+        self.last_report_path = None
+        self._prefs = _load_prefs()
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipeline")
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(self._executor)
+        asyncio.set_event_loop(self._loop)
+        self._tasks = set()
+        self._job_lock = asyncio.Lock()
 
         self._setup_ui()
         self._auto_detect_project()
+        self._pump_event_loop()
 
     def _setup_ui(self):
         self.root.grid_rowconfigure(1, weight=1)
@@ -884,7 +1278,7 @@ class UltimatePipelineApp:
         title_label = ctk.CTkLabel(
             header,
             text="🚀 Ultimate Pipeline",
-            font=ctk.CTkFont(size=42, weight="bold"),
+            font=_font(42, "bold"),
             text_color="white"
         )
         title_label.pack(pady=(20, 5))
@@ -892,7 +1286,7 @@ class UltimatePipelineApp:
         subtitle_label = ctk.CTkLabel(
             header,
             text="Xcode Build • Test • Diagnostics • Deploy",
-            font=ctk.CTkFont(size=16),
+            font=_font(16),
             text_color=("#e0e0e0", "#b0b0b0")
         )
         subtitle_label.pack()
@@ -909,92 +1303,61 @@ class UltimatePipelineApp:
         ctk.CTkLabel(
             sidebar,
             text="📋 Control Panel",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_font(20, "bold")
         ).pack(pady=(30, 20), padx=20)
 
         self.project_label = ctk.CTkLabel(
             sidebar,
             text="No project loaded",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             wraplength=240,
             justify="left"
         )
         self.project_label.pack(pady=(0, 20), padx=20)
 
-        AnimatedButton(
-            sidebar,
-            text="📁 Open Project",
-            command=self._select_project,
-            height=45,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=("#667eea", "#667eea"),
-            hover_color=("#764ba2", "#764ba2")
-        ).pack(pady=10, padx=20, fill="x")
-
-        AnimatedButton(
-            sidebar,
-            text="📱 Select Target",
-            command=self._select_target,
-            height=45,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=("#f093fb", "#f093fb"),
-            hover_color=("#f5576c", "#f5576c")
-        ).pack(pady=10, padx=20, fill="x")
-
-        AnimatedButton(
-            sidebar,
-            text="🔨 Build Project",
-            command=self._build_project,
-            height=45,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=("#4facfe", "#4facfe"),
-            hover_color=("#00f2fe", "#00f2fe")
-        ).pack(pady=10, padx=20, fill="x")
-
-        AnimatedButton(
-            sidebar,
-            text="🧪 Run Tests",
-            command=self._run_tests,
-            height=45,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=("#43e97b", "#43e97b"),
-            hover_color=("#38f9d7", "#38f9d7")
-        ).pack(pady=10, padx=20, fill="x")
-
-        AnimatedButton(
-            sidebar,
-            text="🔍 Run Diagnostics",
-            command=self._run_diagnostics,
-            height=45,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=("#fa709a", "#fa709a"),
-            hover_color=("#fee140", "#fee140")
-        ).pack(pady=10, padx=20, fill="x")
+        font = _font(14, "bold")
+        for text, command, fg_color, hover_color, attr in _SIDEBAR_BUTTONS:
+            button = AnimatedButton(
+                sidebar,
+                text=text,
+                command=getattr(self, command),
+                height=45,
+                font=font,
+                fg_color=fg_color,
+                hover_color=hover_color
+            )
+            button.pack(pady=10, padx=20, fill="x")
+            if attr:
+                setattr(self, attr, button)
 
-        AnimatedButton(
+        self.skip_test_indexing_var = tk.BooleanVar(value=self._prefs.get("skip_test_indexing", False))
+        ctk.CTkCheckBox(
             sidebar,
-            text="📊 Generate Report",
-            command=self._generate_report,
-            height=45,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=("#30cfd0", "#30cfd0"),
-            hover_color=("#330867", "#330867")
-        ).pack(pady=10, padx=20, fill="x")
+            text="Skip indexing during tests",
+            variable=self.skip_test_indexing_var,
+            command=self._toggle_skip_test_indexing,
+            font=_font(12)
+        ).pack(pady=10, padx=20, anchor="w")
 
-        self.tabview = ctk.CTkTabview(main_container)
+        self.tabview = ctk.CTkTabview(main_container, command=self._on_tab_change)
         self.tabview.grid(row=0, column=1, sticky="nsew")
 
-        self.tabview.add("Dashboard")
-        self.tabview.add("Build Log")
-        self.tabview.add("Test Results")
-        self.tabview.add("Diagnostics")
-        self.tabview.add("Reports")
-
-        self._setup_dashboard_tab()
-        self._setup_build_log_tab()
-        self._setup_test_results_tab()
-        self._setup_diagnostics_tab()
-        self._setup_reports_tab()
+        self._tab_builders = {
+            "Dashboard": self._setup_dashboard_tab,
+            "Build Log": self._setup_build_log_tab,
+            "Test Results": self._setup_test_results_tab,
+            "Diagnostics": self._setup_diagnostics_tab,
+            "Reports": self._setup_reports_tab,
+        }
+        self._tabs = {name: self.tabview.add(name) for name in self._tab_builders}
+        self._built_tabs = set()
+        self._dirty_tabs = set()
+        self._tab_refreshers = {
+            "Test Results": self._update_test_display,
+            "Diagnostics": self._update_diagnostics_display,
+        }
+
+        self._build_tab("Dashboard")
 
         status_bar = ctk.CTkFrame(self.root, height=40, fg_color=("#e0e0e0", "#1a1a1a"))
         status_bar.grid(row=2, column=0, sticky="ew", padx=0, pady=0)
@@ -1002,7 +1365,7 @@ class UltimatePipelineApp:
         self.status_label = ctk.CTkLabel(
             status_bar,
             text="🎯 Ready",
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         self.status_label.pack(side="left", padx=20, pady=10)
 
@@ -1010,9 +1373,7 @@ class UltimatePipelineApp:
         self.progress_bar.pack(side="right", padx=20, pady=10)
         self.progress_bar.set(0)
 
-    def _setup_dashboard_tab(self):
-        tab = self.tabview.tab("Dashboard")
-
+    def _setup_dashboard_tab(self, tab):
         stats_frame = ctk.CTkFrame(tab, fg_color="transparent")
         stats_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
@@ -1028,37 +1389,10 @@ class UltimatePipelineApp:
 
         ctk.CTkLabel(
             welcome_frame,
-            text="Welcome to Ultimate Pipeline! 🚀",
-            font=ctk.CTkFont(size=28, weight="bold")
-        ).pack(pady=(40, 20))
-
-        ctk.CTkLabel(
-            welcome_frame,
-            text="The most advanced Xcode build, test, and diagnostics tool",
-            font=ctk.CTkFont(size=16),
-            text_color="gray"
-        ).pack(pady=(0, 40))
-
-        features_text = """
-        ✨ Features:
-
-        • Automatic project detection and configuration
-        • Build automation with real-time progress tracking
-        • Comprehensive test execution and reporting
-        • Deep diagnostics and code quality analysis
-        • Beautiful HTML reports with interactive visualizations
-        • Support for simulators and physical devices
-        • No hardcoded values - works with any project
-
-        Get started by opening a project or let the app auto-detect your current one!
-        """
-
-        ctk.CTkLabel(
-            welcome_frame,
-            text=features_text,
-            font=ctk.CTkFont(size=14),
+            text=_WELCOME_TEXT,
+            font=_font(14),
             justify="left"
-        ).pack(pady=20, padx=40)
+        ).pack(pady=40, padx=40)
 
     def _create_stat_card(self, parent, title, value, row, col):
         card = ctk.CTkFrame(parent, fg_color=("#f8f8f8", "#2a2a2a"), corner_radius=15)
@@ -1067,22 +1401,20 @@ class UltimatePipelineApp:
         ctk.CTkLabel(
             card,
             text=title,
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         ).pack(pady=(20, 10))
 
         value_label = ctk.CTkLabel(
             card,
             text=value,
-            font=ctk.CTkFont(size=32, weight="bold"),
-            text_color=("#667eea", "#667eea")
+            font=_font(32, "bold"),
+            text_color="#667eea"
         )
         value_label.pack(pady=(0, 20))
 
         return value_label
 
-    def _setup_build_log_tab(self):
-        tab = self.tabview.tab("Build Log")
-
+    def _setup_build_log_tab(self, tab):
         self.build_log = scrolledtext.ScrolledText(
             tab,
             wrap=tk.WORD,
@@ -1095,10 +1427,12 @@ class UltimatePipelineApp:
             pady=15
         )
         self.build_log.pack(fill="both", expand=True, padx=10, pady=10)
+        self.build_log.tag_configure("err", foreground="#f5576c")
+        self.build_log.tag_configure("warn", foreground="#fee140")
 
-    def _setup_test_results_tab(self):
-        tab = self.tabview.tab("Test Results")
+        self._flush_log()
 
+    def _setup_test_results_tab(self, tab):
         self.test_tree = ttk.Treeview(
             tab,
             columns=("Status", "Duration"),
@@ -1119,13 +1453,9 @@ class UltimatePipelineApp:
         self.test_tree.pack(side="left", fill="both", expand=True, padx=(10, 0), pady=10)
         scrollbar.pack(side="right", fill="y", padx=(0, 10), pady=10)
 
-        style = ttk.Style()
-        style.configure("Treeview", rowheight=30, font=("Helvetica", 11))
-        style.configure("Treeview.Heading", font=("Helvetica", 12, "bold"))
-
-    def _setup_diagnostics_tab(self):
-        tab = self.tabview.tab("Diagnostics")
+        self._update_test_display()
 
+    def _setup_diagnostics_tab(self, tab):
         self.diagnostics_tree = ttk.Treeview(
             tab,
             columns=("Category", "Severity", "File"),
@@ -1148,19 +1478,19 @@ class UltimatePipelineApp:
         self.diagnostics_tree.pack(side="left", fill="both", expand=True, padx=(10, 0), pady=10)
         scrollbar.pack(side="right", fill="y", padx=(0, 10), pady=10)
 
-    def _setup_reports_tab(self):
-        tab = self.tabview.tab("Reports")
+        self._update_diagnostics_display()
 
+    def _setup_reports_tab(self, tab):
         ctk.CTkLabel(
             tab,
             text="📊 Reports Center",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(24, "bold")
         ).pack(pady=(30, 20))
 
         self.report_status = ctk.CTkLabel(
             tab,
-            text="No reports generated yet",
-            font=ctk.CTkFont(size=14),
+            text=self._report_status_text(),
+            font=_font(14),
             text_color="gray"
         )
         self.report_status.pack(pady=20)
@@ -1168,16 +1498,17 @@ class UltimatePipelineApp:
         button_frame = ctk.CTkFrame(tab, fg_color="transparent")
         button_frame.pack(pady=20)
 
-        AnimatedButton(
+        self.generate_report_btn = AnimatedButton(
             button_frame,
             text="📊 Generate HTML Report",
             command=self._generate_report,
             width=250,
             height=50,
-            font=ctk.CTkFont(size=16, weight="bold"),
-            fg_color=("#667eea", "#667eea"),
-            hover_color=("#764ba2", "#764ba2")
-        ).pack(pady=10)
+            font=_font(16, "bold"),
+            fg_color="#667eea",
+            hover_color="#764ba2"
+        )
+        self.generate_report_btn.pack(pady=10)
 
         self.open_report_btn = AnimatedButton(
             button_frame,
@@ -1185,19 +1516,53 @@ class UltimatePipelineApp:
             command=self._open_latest_report,
             width=250,
             height=50,
-            font=ctk.CTkFont(size=16, weight="bold"),
-            fg_color=("#4facfe", "#4facfe"),
-            hover_color=("#00f2fe", "#00f2fe"),
-            state="disabled"
+            font=_font(16, "bold"),
+            fg_color="#4facfe",
+            hover_color="#00f2fe",
+            state="normal" if self.last_report_path else "disabled"
         )
         self.open_report_btn.pack(pady=10)
 
-        self.last_report_path = None
+        self.auto_open_report_var = tk.BooleanVar(value=self._prefs.get("auto_open_report", False))
+        ctk.CTkCheckBox(
+            tab,
+            text="Open new reports automatically",
+            variable=self.auto_open_report_var,
+            command=self._toggle_auto_open_report,
+            font=_font(14)
+        ).pack(pady=10)
+
+    def _report_status_text(self):
+        if not self.last_report_path:
+            return "No reports generated yet"
+        return f"✅ Report saved to:\n{os.path.basename(self.last_report_path)}"
+
+    def _on_tab_change(self):
+        name = self.tabview.get()
+        self._build_tab(name)
+        if name in self._dirty_tabs:
+            self._dirty_tabs.discard(name)
+            self._tab_refreshers[name]()
+
+    def _build_tab(self, name):
+        if name in self._built_tabs:
+            return
+        self._built_tabs.add(name)
+        self._dirty_tabs.discard(name)
+        self._tab_builders[name](self._tabs[name])
+
+    def _mark_dirty(self, name):
+        if self.tabview.get() == name:
+            self._tab_refreshers[name]()
+        else:
+            self._dirty_tabs.add(name)
 
     def _auto_detect_project(self):
-        cwd = os.getcwd()
-        self.project_config = XcodeDetector.find_project(cwd)
+        self._set_status("🔍 Detecting project...")
+        self._start_job(self._do_auto_detect(os.getcwd()))
 
+    async def _do_auto_detect(self, cwd):
+        self.project_config = await self._run_blocking(XcodeDetector.find_project, cwd)
         if self.project_config:
             self._update_project_display()
             self._log(f"✅ Auto-detected project: {self.project_config.name}")
@@ -1209,14 +1574,20 @@ class UltimatePipelineApp:
     def _select_project(self):
         directory = filedialog.askdirectory(title="Select Xcode Project Directory")
         if directory:
-            self.project_config = XcodeDetector.find_project(directory)
-            if self.project_config:
-                os.chdir(directory)
-                self._update_project_display()
-                self._log(f"✅ Loaded project: {self.project_config.name}")
-                self._set_status(f"📦 Project: {self.project_config.name}")
-            else:
-                messagebox.showerror("Error", "No Xcode project found in selected directory")
+            self._set_status("🔍 Loading project...")
+            self._start_job(self._do_select_project(directory))
+
+    async def _do_select_project(self, directory):
+        config = await self._run_blocking(XcodeDetector.find_project, directory)
+        if config:
+            self.project_config = config
+            os.chdir(directory)
+            self._update_project_display()
+            self._log(f"✅ Loaded project: {self.project_config.name}")
+            self._set_status(f"📦 Project: {self.project_config.name}")
+        else:
+            self._set_status("❌ No Xcode project found")
+            self.root.after(0, messagebox.showerror, "Error", "No Xcode project found in selected directory")
 
     def _update_project_display(self):
         if self.project_config:
@@ -1239,7 +1610,7 @@ class UltimatePipelineApp:
         ctk.CTkLabel(
             dialog,
             text="📱 Select Deployment Target",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(24, "bold")
         ).pack(pady=20)
 
         target_type = tk.StringVar(value="simulator")
@@ -1252,8 +1623,8 @@ class UltimatePipelineApp:
             text="📱 Simulator",
             variable=target_type,
             value="simulator",
-            font=ctk.CTkFont(size=14),
-            command=lambda: self._update_target_list(listbox, target_type.get())
+            font=_font(14),
+            command=lambda: show_targets(target_type.get())
         ).pack(side="left", padx=20)
 
         ctk.CTkRadioButton(
@@ -1261,8 +1632,8 @@ class UltimatePipelineApp:
             text="📲 Physical Device",
             variable=target_type,
             value="device",
-            font=ctk.CTkFont(size=14),
-            command=lambda: self._update_target_list(listbox, target_type.get())
+            font=_font(14),
+            command=lambda: show_targets(target_type.get())
         ).pack(side="left", padx=20)
 
         listbox_frame = ctk.CTkFrame(dialog)
@@ -1281,30 +1652,52 @@ class UltimatePipelineApp:
         )
         listbox.pack(fill="both", expand=True, padx=5, pady=5)
 
-        self._update_target_list(listbox, "simulator")
+        shown_targets: List[Dict] = []
+
+        def show_targets(kind):
+            shown_targets[:] = self._update_target_list(listbox, kind)
+
+        show_targets("simulator")
 
         def on_select():
             selection = listbox.curselection()
             if selection:
                 idx = selection[0]
-                targets = XcodeDetector.get_simulators() if target_type.get() == "simulator" else XcodeDetector.get_devices()
-                if idx < len(targets):
-                    self.selected_target = targets[idx]
+                if idx < len(shown_targets):
+                    self.selected_target = dict(shown_targets[idx])
                     self.selected_target["type"] = target_type.get()
                     self._log(f"✅ Selected target: {self.selected_target['name']}")
                     self._set_status(f"📱 Target: {self.selected_target['name']}")
                     dialog.destroy()
 
+        def on_refresh():
+            XcodeDetector.invalidate_cache()
+            show_targets(target_type.get())
+
+        button_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        button_frame.pack(pady=20)
+
         AnimatedButton(
-            dialog,
+            button_frame,
+            text="🔄 Refresh",
+            command=on_refresh,
+            width=200,
+            height=40,
+            font=_font(14, "bold"),
+            fg_color="#4facfe",
+            hover_color="#00f2fe"
+        ).pack(side="left", padx=10)
+
+        AnimatedButton(
+            button_frame,
             text="Select",
             command=on_select,
             width=200,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=("#667eea", "#667eea"),
-            hover_color=("#764ba2", "#764ba2")
-        ).pack(pady=20)
+            font=_font(14, "bold"),
+            fg_color="#667eea",
+            hover_color="#764ba2"
+        ).pack(side="left", padx=10)
 
     def _update_target_list(self, listbox, target_type):
         listbox.delete(0, tk.END)
@@ -1320,6 +1713,8 @@ class UltimatePipelineApp:
                 status_icon = "🟢" if target["state"] == "Connected" else "🔴"
                 listbox.insert(tk.END, f"{status_icon} {target['name']}")
 
+        return targets
+
     def _build_project(self):
         if not self.project_config:
             messagebox.showwarning("Warning", "Please open a project first")
@@ -1329,50 +1724,73 @@ class UltimatePipelineApp:
             messagebox.showwarning("Warning", "Please select a target first")
             return
 
+        self._start_job(self._do_build(), self.build_btn)
+
+    async def _do_build(self):
         self._clear_build_log()
         self._set_status("🔨 Building...")
         self.progress_bar.set(0)
 
-        def build_thread():
-            cmd = ["xcodebuild", "clean", "build"]
+        cmd = ["xcodebuild", "clean", "build"]
 
-            if self.project_config.is_workspace:
-                cmd.extend(["-workspace", self.project_config.project_file])
-            else:
-                cmd.extend(["-project", self.project_config.project_file])
+        if self.project_config.is_workspace:
+            cmd.extend(["-workspace", self.project_config.project_file])
+        else:
+            cmd.extend(["-project", self.project_config.project_file])
+
+        cmd.extend([
+            "-scheme", self.project_config.scheme,
+            "-destination", f"id={self.selected_target['uuid']}"
+        ])
 
-            cmd.extend([
-                "-scheme", self.project_config.scheme,
-                "-destination", f"id={self.selected_target['uuid']}"
-            ])
+        bundle_dir = tempfile.mkdtemp(prefix="ultimate_pipeline_")
+        bundle_path = os.path.join(bundle_dir, "result.xcresult")
+        cmd.extend(["-resultBundlePath", bundle_path])
 
-            self._log("🔨 Starting build...")
-            self._log(f"$ {' '.join(cmd[:5])}...\n")
+        self._log("🔨 Starting build...")
+        self._log(f"$ {' '.join(cmd[:5])}...\n")
 
-            success, output, _ = CommandRunner.run(
+        stdout_lines = []
+
+        def on_output(text):
+            self._append_build_log(text)
+            low = text.lower()
+            if "error:" in low or "warning:" in low:
+                stdout_lines.extend([
+                    line for line, low_line in zip(text.split("\n"), low.split("\n"))
+                    if "error:" in low_line or "warning:" in low_line
+                ])
+
+        try:
+            success, _, _ = await CommandRunner.run_async(
                 cmd,
                 self.project_config.path,
-                lambda line: self._append_build_log(line)
+                on_output,
+                keep_output=False
             )
+            record = await ResultBundleReader.load(bundle_path)
+        finally:
+            shutil.rmtree(bundle_dir, ignore_errors=True)
 
-            self.build_success = success
-
-            if success:
-                self._log("\n✅ Build succeeded!")
-                self._set_status("✅ Build successful")
-                self.build_stat.configure(text="Success", text_color="#43e97b")
-            else:
-                self._log("\n❌ Build failed!")
-                self._set_status("❌ Build failed")
-                self.build_stat.configure(text="Failed", text_color="#f5576c")
+        self.build_success = success
 
-            self.progress_bar.set(1.0)
+        if success:
+            self._log("\n✅ Build succeeded!")
+            self._set_status("✅ Build successful")
+            self.build_stat.configure(text="Success", text_color="#43e97b")
+        else:
+            self._log("\n❌ Build failed!")
+            self._set_status("❌ Build failed")
+            self.build_stat.configure(text="Failed", text_color="#f5576c")
 
-            build_issues = DiagnosticsEngine.analyze_build_output(output)
-            self.diagnostic_issues.extend(build_issues)
-            self._update_diagnostics_display()
+        self.progress_bar.set(1.0)
 
-        threading.Thread(target=build_thread, daemon=True).start()
+        if record is None:
+            self._log("⚠️ Could not read the build result bundle, using build output")
+            self.diagnostic_issues.extend(DiagnosticsEngine.analyze_build_output("\n".join(stdout_lines)))
+        else:
+            self.diagnostic_issues.extend(DiagnosticsEngine.analyze_build_result(record))
+        self._mark_dirty("Diagnostics")
 
     def _run_tests(self):
         if not self.project_config:
@@ -1383,158 +1801,324 @@ class UltimatePipelineApp:
             messagebox.showwarning("Warning", "Please select a target first")
             return
 
+        self._start_job(self._do_tests(), self.test_btn)
+
+    async def _do_tests(self):
         self._clear_build_log()
         self._set_status("🧪 Running tests...")
         self.progress_bar.set(0)
 
-        def test_thread():
-            cmd = ["xcodebuild", "test"]
+        cmd = ["xcodebuild", "test"]
 
-            if self.project_config.is_workspace:
-                cmd.extend(["-workspace", self.project_config.project_file])
-            else:
-                cmd.extend(["-project", self.project_config.project_file])
+        if self.project_config.is_workspace:
+            cmd.extend(["-workspace", self.project_config.project_file])
+        else:
+            cmd.extend(["-project", self.project_config.project_file])
+
+        cmd.extend([
+            "-scheme", self.project_config.scheme,
+            "-destination", f"id={self.selected_target['uuid']}"
+        ])
+
+        bundle_dir = tempfile.mkdtemp(prefix="ultimate_pipeline_")
+        bundle_path = os.path.join(bundle_dir, "result.xcresult")
+        cmd.extend(["-resultBundlePath", bundle_path])
 
-            cmd.extend([
-                "-scheme", self.project_config.scheme,
-                "-destination", f"id={self.selected_target['uuid']}"
-            ])
+        self._log("🧪 Starting tests...")
+        self._log(f"$ {' '.join(cmd[:5])}...\n")
 
-            self._log("🧪 Starting tests...")
-            self._log(f"$ {' '.join(cmd[:5])}...\n")
+        stdout_lines = []
 
-            success, output, _ = CommandRunner.run(
+        def on_output(text):
+            self._append_build_log(text)
+            stdout_lines.extend(match.group(0) for match in _TEST_CASE_RE.finditer(text))
+            stdout_lines.extend(match.group(0) for match in _TEST_SUMMARY_RE.finditer(text))
+
+        try:
+            await CommandRunner.run_async(
                 cmd,
                 self.project_config.path,
-                lambda line: self._append_build_log(line)
+                on_output,
+                skip_indexing=self._prefs.get("skip_test_indexing", False),
+                keep_output=False
             )
+            summaries = await ResultBundleReader.load_tests(bundle_path)
+        finally:
+            shutil.rmtree(bundle_dir, ignore_errors=True)
 
-            tests, total, passed, failed = TestParser.parse_results(output)
-            self.test_results = tests
-
-            self._log(f"\n📊 Test Results: {passed} passed, {failed} failed out of {total} total")
-            self._set_status(f"🧪 Tests: {passed}/{total} passed")
+        if summaries is None:
+            self._log("⚠️ Could not read test results from the result bundle, using test output")
+            tests, total, passed, failed = TestParser.parse_results("\n".join(stdout_lines))
+        else:
+            tests, total, passed, failed = TestParser.parse_result_bundle(summaries)
+        self.test_results = tests
 
-            self.test_stat.configure(text=f"{passed} / {total}")
-            self.pass_stat.configure(text=str(passed))
+        self._log(f"\n📊 Test Results: {passed} passed, {failed} failed out of {total} total")
+        self._set_status(f"🧪 Tests: {passed}/{total} passed")
 
-            self._update_test_display()
-            self.progress_bar.set(1.0)
+        self.test_stat.configure(text=f"{passed} / {total}")
+        self.pass_stat.configure(text=str(passed))
 
-        threading.Thread(target=test_thread, daemon=True).start()
+        self._mark_dirty("Test Results")
+        self.progress_bar.set(1.0)
 
     def _run_diagnostics(self):
         if not self.project_config:
             messagebox.showwarning("Warning", "Please open a project first")
             return
 
+        self._start_job(self._do_diagnostics(), self.diagnostics_btn)
+
+    async def _do_diagnostics(self):
         self._set_status("🔍 Running diagnostics...")
         self.progress_bar.set(0)
 
-        def diagnostics_thread():
-            self._log("🔍 Running code quality analysis...")
-
-            code_issues = DiagnosticsEngine.analyze_source_code(self.project_config.path)
-            self.diagnostic_issues.extend(code_issues)
+        self._log("🔍 Running code quality analysis...")
 
-            self._log(f"✅ Found {len(code_issues)} code quality issues")
-            self._set_status(f"🔍 Diagnostics complete: {len(self.diagnostic_issues)} issues")
+        code_issues = await self._run_blocking(DiagnosticsEngine.analyze_source_code, self.project_config.path)
+        self.diagnostic_issues.extend(code_issues)
 
-            self.issue_stat.configure(text=str(len(self.diagnostic_issues)))
-            self._update_diagnostics_display()
-            self.progress_bar.set(1.0)
+        self._log(f"✅ Found {len(code_issues)} code quality issues")
+        self._set_status(f"🔍 Diagnostics complete: {len(self.diagnostic_issues)} issues")
 
-        threading.Thread(target=diagnostics_thread, daemon=True).start()
+        self.issue_stat.configure(text=str(len(self.diagnostic_issues)))
+        self._mark_dirty("Diagnostics")
+        self.progress_bar.set(1.0)
 
     def _generate_report(self):
         if not self.project_config:
             messagebox.showwarning("Warning", "Please open a project first")
             return
 
+        buttons = [self.report_btn]
+        if "Reports" in self._built_tabs:
+            buttons.append(self.generate_report_btn)
+        self._start_job(self._do_report(), *buttons)
+
+    async def _do_report(self):
         self._set_status("📊 Generating report...")
 
-        def report_thread():
-            html = ReportGenerator.generate_html(
-                self.project_config,
-                self.test_results,
-                self.diagnostic_issues,
-                self.build_success
-            )
+        report_path = await self._loop.run_in_executor(
+            None,
+            ReportGenerator.stream_html,
+            ReportGenerator.report_path(self.project_config.path),
+            self.project_config,
+            self.test_results,
+            self.diagnostic_issues,
+            self.build_success
+        )
+        self.last_report_path = report_path
 
-            report_path = ReportGenerator.save_report(html, self.project_config.path)
-            self.last_report_path = report_path
+        self._log(f"📊 Report saved: {report_path}")
+        self._set_status("✅ Report generated")
 
-            self._log(f"📊 Report saved: {report_path}")
-            self._set_status("✅ Report generated")
+        if "Reports" in self._built_tabs:
+            self.report_status.configure(text=self._report_status_text())
+            self.open_report_btn.configure(state="normal")
 
-            self.root.after(0, lambda: self.report_status.configure(
-                text=f"✅ Report saved to:\n{os.path.basename(report_path)}"
-            ))
-            self.root.after(0, lambda: self.open_report_btn.configure(state="normal"))
+        self.root.after(0, self._offer_to_open_report, report_path)
+
+    def _offer_to_open_report(self, report_path):
+        if self._prefs.get("auto_open_report") or messagebox.askyesno(
+            "Report Generated", "Report generated successfully!\n\nOpen in browser?"
+        ):
+            threading.Thread(target=_open_report_file, args=(report_path,), daemon=True).start()
 
-            if messagebox.askyesno("Report Generated", "Report generated successfully!\n\nOpen in browser?"):
-                webbrowser.open(f"file://{report_path}")
+    def _toggle_auto_open_report(self):
+        self._prefs["auto_open_report"] = self.auto_open_report_var.get()
+        _save_prefs(self._prefs)
 
-        threading.Thread(target=report_thread, daemon=True).start()
+    def _toggle_skip_test_indexing(self):
+        self._prefs["skip_test_indexing"] = self.skip_test_indexing_var.get()
+        _save_prefs(self._prefs)
 
     def _open_latest_report(self):
         if self.last_report_path and os.path.exists(self.last_report_path):
-            webbrowser.open(f"file://{self.last_report_path}")
+            threading.Thread(target=_open_report_file, args=(self.last_report_path,), daemon=True).start()
         else:
             messagebox.showwarning("Warning", "No report available")
 
     def _update_test_display(self):
-        for item in self.test_tree.get_children():
-            self.test_tree.delete(item)
-
-        for test in self.test_results:
-            status_emoji = "✅" if test.status == "passed" else "❌"
-            status_text = f"{status_emoji} {test.status.upper()}"
-            duration_text = f"{test.duration:.3f}s"
-
-            self.test_tree.insert(
-                "",
-                "end",
-                text=test.name,
-                values=(status_text, duration_text)
-            )
+        if "Test Results" not in self._built_tabs:
+            return
+
+        rendered_tests, rendered_count = self._rendered_tests
+        if rendered_tests is self.test_results and rendered_count == len(self.test_results):
+            return
+        self._rendered_tests = (self.test_results, len(self.test_results))
+
+        rows = [(test.name, test.name, (test.status_text, test.duration_text)) for test in self.test_results]
+
+        self._fill_tree(self.test_tree, rows, self._test_rows)
 
     def _update_diagnostics_display(self):
-        for item in self.diagnostics_tree.get_children():
-            self.diagnostics_tree.delete(item)
+        if "Diagnostics" not in self._built_tabs:
+            return
 
+        rendered_issues, rendered_count = self._rendered_issues
+        if rendered_issues is self.diagnostic_issues and rendered_count == len(self.diagnostic_issues):
+            return
+        self._rendered_issues = (self.diagnostic_issues, len(self.diagnostic_issues))
+
+        rows = []
         for issue in self.diagnostic_issues:
-            severity_emoji = {
-                "critical": "🔴",
-                "warning": "🟡",
-                "info": "🔵"
-            }.get(issue.severity, "⚪")
-
-            severity_text = f"{severity_emoji} {issue.severity.upper()}"
-            file_name = os.path.basename(issue.file) if issue.file else "N/A"
-
-            self.diagnostics_tree.insert(
-                "",
-                "end",
-                text=issue.message[:100],
-                values=(issue.category, severity_text, file_name)
-            )
+            text = issue.message[:100]
+            values = (issue.category, issue.severity_text, issue.file_name)
+            rows.append(((text, values), text, values))
+
+        self._fill_tree(self.diagnostics_tree, rows, self._issue_rows)
+
+    def _fill_tree(self, tree, rows, resident):
+        current = {}
+        seen = {}
+        inserted = 0
+
+        for key, text, values in rows:
+            occurrence = seen.get(key, 0)
+            seen[key] = occurrence + 1
+            key = (key, occurrence)
+
+            entry = resident.pop(key, None)
+            if entry is None:
+                entry = (tree.insert("", "end", text=text, values=values), text, values)
+                inserted += 1
+                if inserted % _TREE_INSERT_BATCH == 0:
+                    self.root.update_idletasks()
+            elif entry[1] != text or entry[2] != values:
+                tree.item(entry[0], text=text, values=values)
+                entry = (entry[0], text, values)
+            current[key] = entry
+
+        if resident:
+            tree.delete(*(entry[0] for entry in resident.values()))
+
+        order = [entry[0] for entry in current.values()]
+        if list(tree.get_children()) != order:
+            tree.set_children("", *order)
+
+        resident.clear()
+        resident.update(current)
 
     def _log(self, message):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] {message}\n"
-        self.root.after(0, lambda: self._append_build_log(log_message))
+        self._append_build_log(f"[{_timestamp()}] {message}\n")
 
     def _append_build_log(self, text):
-        self.build_log.insert(tk.END, text)
+        if "Build Log" not in self._built_tabs:
+            self._log_buffer.extend(text.splitlines(True))
+            return
+
+        self._log_buffer.append(text)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after(_LOG_FLUSH_INTERVAL_MS, self._flush_log)
+
+    def _flush_log(self):
+        self._log_flush_scheduled = False
+        if not self._log_buffer:
+            return
+
+        text = "".join(self._log_buffer)
+        self._log_buffer.clear()
+
+        low = text.lower()
+        if "error:" in low or "warning:" in low:
+            self.build_log.insert(tk.END, *self._tag_log_lines(text))
+        else:
+            self.build_log.insert(tk.END, text)
+        self.build_log.delete(1.0, f"end-{_LOG_MAX_LINES} lines")
         self.build_log.see(tk.END)
-        self.root.update_idletasks()
+
+    @staticmethod
+    def _tag_log_lines(text):
+        segments = []
+        plain = []
+        for line in text.splitlines(True):
+            low = line.lower()
+            if "error:" in low:
+                tag = "err"
+            elif "warning:" in low:
+                tag = "warn"
+            else:
+                plain.append(line)
+                continue
+
+            if plain:
+                segments += ("".join(plain), ())
+                plain.clear()
+            segments += (line, tag)
+
+        if plain:
+            segments += ("".join(plain), ())
+        return segments
 
     def _clear_build_log(self):
-        self.build_log.delete(1.0, tk.END)
+        self._log_buffer.clear()
+        if "Build Log" in self._built_tabs:
+            self.build_log.delete(1.0, tk.END)
 
     def _set_status(self, text):
-        self.root.after(0, lambda: self.status_label.configure(text=text))
+        self.status_label.configure(text=text)
+
+    def _start_job(self, coro, *buttons):
+        for button in buttons:
+            button.configure(state="disabled")
+
+        task = self._loop.create_task(self._run_job(coro))
+        self._tasks.add(task)
+        task.add_done_callback(lambda done: self._finish_job(done, buttons))
+
+    async def _run_job(self, coro):
+        try:
+            async with self._job_lock:
+                await coro
+        finally:
+            coro.close()
+
+    def _finish_job(self, task, buttons):
+        self._tasks.discard(task)
+        for button in buttons:
+            button.configure(state="normal")
+
+        if not task.cancelled() and task.exception():
+            self._log(f"❌ {task.exception()}")
+            self._set_status("❌ Task failed")
+
+    def _pump_event_loop(self):
+        if not self._loop.is_running():
+            self._loop.call_soon(self._loop.stop)
+            self._loop.run_forever()
+        self.root.after(10 if self._tasks else 50, self._pump_event_loop)
+
+    def _run_blocking(self, fn, *args):
+        future = self._loop.create_future()
+
+        def settle(setter, value):
+            if not future.done():
+                setter(value)
+
+        def worker():
+            try:
+                outcome = (future.set_result, fn(*args))
+            except Exception as e:
+                outcome = (future.set_exception, e)
+            try:
+                self._loop.call_soon_threadsafe(settle, *outcome)
+            except RuntimeError:
+                pass
+
+        threading.Thread(target=worker, daemon=True).start()
+        return future
+
+    def _on_close(self):
+        _SCAN_CANCELLED.set()
+        for task in self._tasks:
+            task.cancel()
+        if self._tasks:
+            self._loop.run_until_complete(asyncio.gather(*self._tasks, return_exceptions=True))
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._loop.close()
+        self.root.destroy()
 
     def run(self):
         self.root.mainloop()